@@ -1,3 +1,12 @@
+import matplotlib
+
+# These scripts only write PNGs; the non-interactive Agg backend skips
+# GUI initialization entirely.
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
 MARKERS = {
     "NonMix": "o",
     "PureCoinFlipping": "s",
@@ -22,3 +31,184 @@ X_FIELDS = [
     "sender_data_msg_prob",
     "mix_data_msg_prob",
 ]
+
+
+def analyze_all(
+    data: pd.DataFrame,
+    field_groups: list[list[str]],
+    name: str,
+    outdir: str,
+    figsize: tuple[float, float],
+    y_bottom: float,
+    cap_ylim: bool,
+):
+    """
+    Run the versus-analysis for every field in X_FIELDS.
+    The max-paramset row selection is shared across all x fields:
+    melting once into tidy (x_field, x_value) form and deduplicating the
+    long frame replaces one sort-and-dedup pass per x field with one
+    pass over the whole data.
+    """
+    flatten_fields = [field for fields in field_groups for field in fields]
+    long = data.melt(
+        id_vars=["paramset", "queue_type", *flatten_fields],
+        value_vars=X_FIELDS,
+        var_name="x_field",
+        value_name="x_value",
+    )
+    picks = long.sort_values("paramset").drop_duplicates(
+        ["x_field", "x_value", "queue_type"], keep="last"
+    )
+    for x_field, group in picks.groupby("x_field", sort=False):
+        # Restore the x column's name and original dtype
+        # (melt widens mixed int/float x fields to float).
+        group = group.rename(columns={"x_value": x_field}).astype(
+            {x_field: data.dtypes[x_field]}
+        )
+        _plot_versus(
+            group, x_field, field_groups, name, outdir, figsize, y_bottom, cap_ylim
+        )
+
+
+def analyze_versus(
+    data: pd.DataFrame,
+    x_field: str,
+    field_groups: list[list[str]],
+    name: str,
+    outdir: str,
+    figsize: tuple[float, float],
+    y_bottom: float,
+    cap_ylim: bool,
+):
+    """
+    Plot each field in field_groups against x_field (one grid column per
+    group, one row per field in the group) and render a value table,
+    saving both as {name}_vs_{x_field}[_table].png in outdir.
+    If cap_ylim is set, the y-axis of each grid column is capped to the
+    column's maximum value (unless it is extreme); otherwise only the
+    bottom is fixed at y_bottom.
+    """
+    # Select the row with the largest paramset for each (x_field, queue_type):
+    # a sort plus drop_duplicates is a linear scan, much cheaper than
+    # the per-group idxmax reduction and the gather through .loc.
+    max_paramset_data = data.sort_values("paramset").drop_duplicates(
+        subset=[x_field, "queue_type"], keep="last"
+    )
+    _plot_versus(
+        max_paramset_data,
+        x_field,
+        field_groups,
+        name,
+        outdir,
+        figsize,
+        y_bottom,
+        cap_ylim,
+    )
+
+
+def _plot_versus(
+    max_paramset_data: pd.DataFrame,
+    x_field: str,
+    field_groups: list[list[str]],
+    name: str,
+    outdir: str,
+    figsize: tuple[float, float],
+    y_bottom: float,
+    cap_ylim: bool,
+):
+    # Partition once by queue_type instead of re-masking the whole frame
+    # for every (axis, field, queue_type) combination, and extract plain NumPy
+    # arrays up front so the plotting loops do no pandas indexing at all.
+    # groupby only yields queue types that actually have rows, so empty
+    # groups are never allocated or plotted; iterating in MARKERS order
+    # keeps the legend order deterministic regardless of row order.
+    plot_columns = [x_field] + [field for fields in field_groups for field in fields]
+    grouped = {
+        queue_type: queue_data
+        for queue_type, queue_data in max_paramset_data.groupby(
+            "queue_type", sort=False, observed=True
+        )
+    }
+    queue_groups = {}
+    for queue_type in MARKERS:
+        if queue_type not in grouped:
+            continue
+        queue_data = grouped[queue_type].sort_values(x_field)
+        queue_groups[queue_type] = {
+            column: queue_data[column].to_numpy() for column in plot_columns
+        }
+
+    # Display the plots
+    nrows = max(len(fields) for fields in field_groups)
+    fig, ax = plt.subplots(nrows, len(field_groups), figsize=figsize, squeeze=False)
+    for ax_col, fields in enumerate(field_groups):
+        # One vectorized reduction over the group's columns at once
+        # instead of a separate pandas .max() pass per field.
+        max_y = max_paramset_data[fields].to_numpy().max(initial=0)
+
+        for ax_row, field in enumerate(fields):
+            for queue_type, arrays in queue_groups.items():
+                x_values = arrays[x_field]
+                y_values = arrays[field]
+                ax[ax_row][ax_col].plot(
+                    x_values,
+                    y_values,
+                    label=queue_type,
+                    marker=MARKERS[queue_type],
+                    color=COLORS[queue_type],
+                )
+
+            ax[ax_row][ax_col].set_title(f"{field} vs {x_field}", fontsize=10)
+            ax[ax_row][ax_col].set_xlabel(x_field)
+            ax[ax_row][ax_col].set_ylabel(field)
+            if ax_row == 0 and ax_col == len(field_groups) - 1:
+                ax[ax_row][ax_col].legend(bbox_to_anchor=(1, 1), loc="upper left")
+            ax[ax_row][ax_col].grid(True)
+            if cap_ylim and max_y < 1e6:
+                ax[ax_row][ax_col].set_ylim(y_bottom, max_y * 1.05)
+            else:
+                ax[ax_row][ax_col].set_ylim(bottom=y_bottom)
+
+    plt.tight_layout()
+    fig.savefig(f"{outdir}/{name}_vs_{x_field}.png")
+
+    # Display the table of values
+    # Create a table with x_field, queue_type, and all plotted fields
+    # (row-major across the grid, so related fields sit side by side)
+    flatten_fields = [
+        field for zipped_fields in zip(*field_groups) for field in zipped_fields
+    ]
+    columns = [x_field, "queue_type"] + flatten_fields
+    table_data = max_paramset_data[columns].sort_values(by=[x_field, "queue_type"])
+    # Prepare to display values with only 2 decimal places,
+    # formatted in one vectorized pass instead of a Python lambda per cell,
+    # narrowed to float32 since 2 decimals are kept anyway.
+    values = table_data[flatten_fields].to_numpy(dtype=np.float32)
+    table_data[flatten_fields] = np.where(
+        np.abs(values) >= 1e6,
+        np.char.mod("%.2e", values),
+        np.char.mod("%.2f", values),
+    )
+    # Display the table as a separate subplot
+    fig_table, ax_table = plt.subplots(
+        figsize=(len(columns) * 1.8, len(table_data) * 0.3)
+    )
+    ax_table.axis("off")  # Turn off the axis
+    table = ax_table.table(
+        cellText=table_data.values,
+        colLabels=table_data.columns,
+        cellLoc="center",
+        loc="center",
+    )
+    table.auto_set_font_size(False)
+    table.set_fontsize(10)
+    table.scale(1, 1.5)
+    for i in range(len(table_data.columns)):
+        table.auto_set_column_width(i)
+
+    fig_table.savefig(f"{outdir}/{name}_vs_{x_field}_table.png")
+
+    # Close the figures explicitly: pyplot would otherwise keep every figure
+    # of every x_field iteration alive in its registry.
+    plt.close(fig)
+    plt.close(fig_table)
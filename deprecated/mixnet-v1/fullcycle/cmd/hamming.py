@@ -26,9 +26,10 @@ def main():
     csv_path1 = sys.argv[1]
     csv_path2 = sys.argv[2]
 
-    # Load the CSV files into DataFrames
-    df1 = pd.read_csv(csv_path1)
-    df2 = pd.read_csv(csv_path2)
+    # Load the CSV files into DataFrames with the multithreaded
+    # pyarrow reader; the node-state matrices can be large.
+    df1 = pd.read_csv(csv_path1, engine="pyarrow")
+    df2 = pd.read_csv(csv_path2, engine="pyarrow")
 
     # Calculate the Hamming distance
     try:
@@ -2,10 +2,20 @@ from __future__ import annotations
 
 import asyncio
 import time
+from collections import deque
 from typing import Any, Awaitable, Coroutine, Generic, TypeVar
 
 from framework import framework
 
+try:
+    # Optional: uvloop's libuv event loop is considerably faster than the
+    # default loop on scheduler-heavy workloads (many long-lived tasks).
+    import uvloop
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 
 class Framework(framework.Framework):
     """
@@ -14,6 +24,11 @@ class Framework(framework.Framework):
 
     def __init__(self):
         super().__init__()
+        # Keep a reference to every spawned task until it is done,
+        # so callers don't have to track tasks just to prevent them
+        # from being garbage collected.
+        # https://docs.python.org/3/library/asyncio-task.html#asyncio.create_task
+        self._tasks: set[asyncio.Task] = set()
 
     def queue(self) -> framework.Queue:
         return Queue()
@@ -22,12 +37,22 @@ class Framework(framework.Framework):
         await asyncio.sleep(seconds)
 
     def now(self) -> float:
-        return time.time()
+        # Monotonic clock: cheaper to read than the wall clock
+        # and immune to system clock adjustments during a simulation.
+        return time.monotonic()
 
     def spawn(
         self, coroutine: Coroutine[Any, Any, framework.RT]
     ) -> Awaitable[framework.RT]:
-        return asyncio.create_task(coroutine)
+        task = asyncio.create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def gather(
+        self, coroutines: list[Coroutine[Any, Any, framework.RT]]
+    ) -> list[framework.RT]:
+        return list(await asyncio.gather(*coroutines))
 
 
 T = TypeVar("T")
@@ -35,18 +60,31 @@ T = TypeVar("T")
 
 class Queue(framework.Queue[T]):
     """
-    An asyncio implementation of the Queue
+    An asyncio implementation of the Queue.
+
+    Queues are used as single-producer single-consumer channels between tasks,
+    so a plain deque plus a single Future waiter is enough.
+    This avoids the per-operation Future allocation and bookkeeping of asyncio.Queue.
     """
 
     def __init__(self):
         super().__init__()
-        self._queue = asyncio.Queue()
+        self._queue: deque[T] = deque()
+        self._waiter: asyncio.Future[None] | None = None
 
     async def put(self, data: T) -> None:
-        await self._queue.put(data)
+        self._queue.append(data)
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
 
     async def get(self) -> T:
-        return await self._queue.get()
+        while not self._queue:
+            self._waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+        return self._queue.popleft()
 
     def empty(self) -> bool:
-        return self._queue.empty()
+        return not self._queue
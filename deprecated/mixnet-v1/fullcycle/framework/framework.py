@@ -28,6 +28,13 @@ class Framework(abc.ABC):
     def spawn(self, coroutine: Coroutine[Any, Any, RT]) -> Awaitable[RT]:
         pass
 
+    async def gather(self, coroutines: list[Coroutine[Any, Any, RT]]) -> list[RT]:
+        """
+        Run coroutines concurrently and wait until all of them are done.
+        """
+        tasks = [self.spawn(coroutine) for coroutine in coroutines]
+        return [await task for task in tasks]
+
 
 T = TypeVar("T")
 
@@ -47,12 +47,18 @@ class Queue(framework.Queue[T]):
     def __init__(self):
         super().__init__()
         self._queue = usim.Queue()
+        # Track the size explicitly instead of peeking at the private
+        # usim buffer, so empty() is a plain int comparison.
+        self._size = 0
 
     async def put(self, data: T) -> None:
+        self._size += 1
         await self._queue.put(data)
 
     async def get(self) -> T:
-        return await self._queue
+        data = await self._queue
+        self._size -= 1
+        return data
 
     def empty(self) -> bool:
-        return len(self._queue._buffer) == 0
+        return self._size == 0
@@ -4,6 +4,7 @@ import random
 from dataclasses import dataclass, field
 from typing import List
 
+import numpy
 from pysphinx.node import X25519PublicKey
 from pysphinx.sphinx import Node as SphinxNode
 from pysphinx.sphinx import X25519PrivateKey
@@ -12,7 +13,7 @@ from protocol.gossip import GossipConfig
 from protocol.temporalmix import TemporalMixConfig
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GlobalConfig:
     """
     Global parameters used across all nodes in the network
@@ -24,7 +25,7 @@ class GlobalConfig:
     max_mix_path_length: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NodeConfig:
     """
     Node-specific parameters
@@ -36,7 +37,7 @@ class NodeConfig:
     temporal_mix: TemporalMixConfig
 
 
-@dataclass
+@dataclass(slots=True)
 class MixMembership:
     """
     A list of public information of nodes in the network.
@@ -45,22 +46,40 @@ class MixMembership:
 
     nodes: List[NodeInfo]
     rng: random.Random = field(default_factory=random.Random)
+    _np_rng: numpy.random.Generator = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # Use a NumPy generator (seeded from `rng` for reproducibility) so that
+        # all indices of a route are drawn in a single C call instead of
+        # one Python-level RNG call per hop.
+        self._np_rng = numpy.random.default_rng(self.rng.randrange(2**63))
 
     def generate_route(self, length: int) -> list[NodeInfo]:
         """
         Choose `length` nodes with replacement as a mix route.
         """
-        return self.rng.choices(self.nodes, k=length)
+        nodes = self.nodes
+        indices = self._np_rng.integers(0, len(nodes), size=length)
+        return [nodes[i] for i in indices]
+
 
+_DUMMY_NODE_ADDR = bytes(32)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class NodeInfo:
     """
     Public information of a node to be shared to all nodes in the network
     """
 
     public_key: X25519PublicKey
+    _sphinx_node: SphinxNode = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Built once since sphinx_node() is called per hop per message.
+        object.__setattr__(
+            self, "_sphinx_node", SphinxNode(self.public_key, _DUMMY_NODE_ADDR)
+        )
 
     def sphinx_node(self) -> SphinxNode:
-        dummy_node_addr = bytes(32)
-        return SphinxNode(self.public_key, dummy_node_addr)
+        return self._sphinx_node
@@ -12,6 +12,8 @@ class SimplexConnection(abc.ABC):
     An abstract class for a simplex connection that can send and receive data in one direction
     """
 
+    __slots__ = ()
+
     @abc.abstractmethod
     async def send(self, data: bytes) -> None:
         pass
@@ -27,6 +29,8 @@ class LocalSimplexConnection(SimplexConnection):
     Data sent through this connection can be immediately received from the other end.
     """
 
+    __slots__ = ("queue",)
+
     def __init__(self, framework: Framework):
         self.queue: Queue[bytes] = framework.queue()
 
@@ -43,6 +47,8 @@ class DuplexConnection:
     This is to mimic duplex communication in a real network (such as TCP or QUIC).
     """
 
+    __slots__ = ("inbound", "outbound")
+
     def __init__(self, inbound: SimplexConnection, outbound: SimplexConnection):
         self.inbound = inbound
         self.outbound = outbound
@@ -59,6 +65,15 @@ class MixSimplexConnection(SimplexConnection):
     Wraps a SimplexConnection to add a transmission rate and noise to the connection.
     """
 
+    __slots__ = (
+        "framework",
+        "queue",
+        "conn",
+        "transmission_rate_per_sec",
+        "_tick_period",
+        "task",
+    )
+
     def __init__(
         self,
         framework: Framework,
@@ -73,11 +88,13 @@ class MixSimplexConnection(SimplexConnection):
         )
         self.conn = conn
         self.transmission_rate_per_sec = transmission_rate_per_sec
+        # Cache the tick period so the hot loop doesn't redo the division.
+        self._tick_period = 1.0 / transmission_rate_per_sec
         self.task = framework.spawn(self.__run())
 
     async def __run(self):
         while True:
-            await self.framework.sleep(1 / self.transmission_rate_per_sec)
+            await self.framework.sleep(self._tick_period)
             msg = await self.queue.get()
             await self.conn.send(msg)
 
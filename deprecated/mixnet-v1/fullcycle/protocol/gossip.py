@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-import hashlib
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Awaitable, Callable, Self
 
+from xxhash import xxh3_64_intdigest
+
 from framework import Framework
 from protocol.connection import (
     DuplexConnection,
@@ -14,10 +16,13 @@ from protocol.connection import (
 from protocol.error import PeeringDegreeReached
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GossipConfig:
     # Expected number of peers each node must connect to if there are enough peers available in the network.
     peering_degree: int
+    # Maximum number of packet digests to keep in the deduplication cache.
+    # Older digests are evicted in LRU order once this limit is reached.
+    packet_cache_size: int = field(default=4096, kw_only=True)
 
 
 class Gossip:
@@ -26,6 +31,15 @@ class Gossip:
     Peers are connected via DuplexConnection.
     """
 
+    __slots__ = (
+        "framework",
+        "config",
+        "conns",
+        "_send_fns",
+        "handler",
+        "packet_cache",
+    )
+
     def __init__(
         self,
         framework: Framework,
@@ -35,12 +49,14 @@ class Gossip:
         self.framework = framework
         self.config = config
         self.conns: list[DuplexConnection] = []
+        # Bound send methods of all connections, cached for the gossip fan-out.
+        self._send_fns: tuple[Callable[[bytes], Awaitable[None]], ...] = ()
         # A handler to process inbound messages.
         self.handler = handler
-        self.packet_cache: set[bytes] = set()
-        # A set just for gathering a reference of tasks to prevent them from being garbage collected.
-        # https://docs.python.org/3/library/asyncio-task.html#asyncio.create_task
-        self.tasks: set[Awaitable] = set()
+        # A bounded LRU of packet digests for deduplication.
+        # A fast non-cryptographic 64-bit hash is sufficient here
+        # because the cache is only used to skip already-seen packets.
+        self.packet_cache: OrderedDict[int | bytes, None] = OrderedDict()
 
     def can_accept_conn(self) -> bool:
         return len(self.conns) < self.config.peering_degree
@@ -55,33 +71,53 @@ class Gossip:
             outbound,
         )
         self.conns.append(conn)
-        task = self.framework.spawn(self.__process_inbound_conn(conn))
-        self.tasks.add(task)
+        self._send_fns = tuple(conn.send for conn in self.conns)
+        self.framework.spawn(self.__process_inbound_conn(conn))
 
     async def __process_inbound_conn(self, conn: DuplexConnection):
         while True:
             msg = await conn.recv()
+            if self._drop_before_cache(msg):
+                continue
             if self.__check_update_cache(msg):
                 continue
             await self.process_inbound_msg(msg)
 
+    def _drop_before_cache(self, msg: bytes) -> bool:
+        """
+        A hook for subclasses: return True for messages that can be dropped
+        before the deduplication cache is consulted, so they are never hashed.
+        """
+        return False
+
     async def process_inbound_msg(self, msg: bytes):
-        await self.gossip(msg)
-        await self.handler(msg)
+        # The relay fan-out and the local handler are independent,
+        # so run them concurrently instead of back to back.
+        await self.framework.gather([self.gossip(msg), self.handler(msg)])
 
     async def gossip(self, msg: bytes):
         """
-        Gossip a message to all connected peers.
+        Gossip a message to all connected peers concurrently.
         """
-        for conn in self.conns:
-            await conn.send(msg)
+        await self.framework.gather([send(msg) for send in self._send_fns])
 
     def __check_update_cache(self, packet: bytes) -> bool:
         """
         Add a message to the cache, and return True if the message was already in the cache.
         """
-        hash = hashlib.sha256(packet).digest()
-        if hash in self.packet_cache:
+        # Packets no longer than a digest are already a compact cache key,
+        # so hashing them would cost more than it saves.
+        # int and bytes keys never compare equal, so the two cannot collide.
+        key = packet if len(packet) <= 32 else xxh3_64_intdigest(packet)
+        cache = self.packet_cache
+        size = len(cache)
+        # Inserting unconditionally answers the membership question through
+        # the length, saving a separate lookup on the miss path.
+        cache[key] = None
+        if len(cache) == size:
+            # Already cached: refresh its LRU position.
+            cache.move_to_end(key)
             return True
-        self.packet_cache.add(hash)
+        if size >= self.config.packet_cache_size:
+            cache.popitem(last=False)
         return False
@@ -16,6 +16,11 @@ from protocol.gossip import Gossip
 from protocol.nomssip import Nomssip, NomssipConfig
 from protocol.sphinx import SphinxPacketBuilder
 
+# The size of a Sphinx packet is a deterministic function of
+# (max_message_size, max_mix_path_length), so a single sample build
+# serves every node in the simulation instead of one per Node.__init__.
+_message_size_cache: dict[tuple[int, int], int] = {}
+
 
 class Node:
     """
@@ -58,12 +63,16 @@ class Node:
         """
         Calculate the actual message size to be gossiped, which depends on the maximum length of mix path.
         """
-        sample_sphinx_packet, _ = SphinxPacketBuilder.build(
-            bytes(global_config.max_message_size),
-            global_config,
-            global_config.max_mix_path_length,
-        )
-        return len(sample_sphinx_packet.bytes())
+        key = (global_config.max_message_size, global_config.max_mix_path_length)
+        size = _message_size_cache.get(key)
+        if size is None:
+            sample_sphinx_packet, _ = SphinxPacketBuilder.build(
+                bytes(global_config.max_message_size),
+                global_config,
+                global_config.max_mix_path_length,
+            )
+            size = _message_size_cache[key] = len(sample_sphinx_packet.bytes())
+        return size
 
     async def __process_msg(self, msg: bytes) -> None:
         """
@@ -73,17 +82,18 @@ class Node:
             msg, self.global_config.max_mix_path_length
         )
         result = await self.__process_sphinx_packet(sphinx_packet)
-        match result:
-            case SphinxPacket():
-                # Gossip the next Sphinx packet
-                await self.nomssip.gossip(result.bytes())
-            case bytes():
-                if self.recovered_msg_handler is not None:
-                    result = await self.recovered_msg_handler(result)
-                # Broadcast the message fully recovered from Sphinx packets
-                await self.broadcast.gossip(result)
-            case None:
-                return
+        # A plain isinstance ladder: class patterns in match/case go through
+        # __match_args__ machinery, which is slower on this per-packet path.
+        if result is None:
+            return
+        if isinstance(result, SphinxPacket):
+            # Gossip the next Sphinx packet
+            await self.nomssip.gossip(result.bytes())
+        else:
+            if self.recovered_msg_handler is not None:
+                result = await self.recovered_msg_handler(result)
+            # Broadcast the message fully recovered from Sphinx packets
+            await self.broadcast.gossip(result)
 
     async def __process_sphinx_packet(
         self, packet: SphinxPacket
@@ -93,11 +103,10 @@ class Node:
         """
         try:
             processed = packet.process(self.config.private_key)
-            match processed:
-                case ProcessedForwardHopPacket():
-                    return processed.next_packet
-                case ProcessedFinalHopPacket():
-                    return processed.payload.recover_plain_playload()
+            if isinstance(processed, ProcessedForwardHopPacket):
+                return processed.next_packet
+            if isinstance(processed, ProcessedFinalHopPacket):
+                return processed.payload.recover_plain_playload()
         except ValueError:
             # Return nothing, if it cannot be unwrapped by the private key of this node.
             return None
@@ -1,8 +1,10 @@
 import random
 from abc import abstractmethod
+from collections import deque
 from dataclasses import dataclass
 from enum import Enum
-from typing import TypeVar
+from itertools import repeat
+from typing import Callable, TypeVar
 
 from framework.framework import Framework, Queue
 
@@ -15,7 +17,7 @@ class TemporalMixType(Enum):
     NOISY_COIN_FLIPPING = "noisy-coin-flipping"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TemporalMixConfig:
     mix_type: TemporalMixType
     # The minimum size of queue to be mixed.
@@ -32,61 +34,51 @@ class TemporalMixConfig:
 T = TypeVar("T")
 
 
+def _swap_pop(queue: list[T], i: int) -> T:
+    """
+    Remove and return the element at position `i` in O(1)
+    by swapping it with the last element before popping.
+    Only safe for queues whose removal position is drawn uniformly or
+    whose contents are shuffled before every draw; anywhere else the
+    swap changes which messages occupy which positions.
+    """
+    queue[i], queue[-1] = queue[-1], queue[i]
+    return queue.pop()
+
+
 class TemporalMix:
     @staticmethod
     def queue(
         config: TemporalMixConfig, framework: Framework, noise_msg: T
     ) -> Queue[T]:
-        match config.mix_type:
-            case TemporalMixType.NONE:
-                return NonMixQueue(framework, noise_msg)
-            case TemporalMixType.PURE_COIN_FLIPPING:
-                return PureCoinFlipppingQueue(
-                    config.min_queue_size,
-                    random.Random(config.seed_generator.random()),
-                    noise_msg,
-                )
-            case TemporalMixType.PURE_RANDOM_SAMPLING:
-                return PureRandomSamplingQueue(
-                    config.min_queue_size,
-                    random.Random(config.seed_generator.random()),
-                    noise_msg,
-                )
-            case TemporalMixType.PERMUTED_COIN_FLIPPING:
-                return PermutedCoinFlipppingQueue(
-                    config.min_queue_size,
-                    random.Random(config.seed_generator.random()),
-                    noise_msg,
-                )
-            case TemporalMixType.NOISY_COIN_FLIPPING:
-                return NoisyCoinFlippingQueue(
-                    random.Random(config.seed_generator.random()),
-                    noise_msg,
-                )
-            case _:
-                raise ValueError(f"Unknown mix type: {config.mix_type}")
+        ctor = _QUEUE_CTORS.get(config.mix_type)
+        if ctor is None:
+            raise ValueError(f"Unknown mix type: {config.mix_type}")
+        return ctor(config, framework, noise_msg)
 
 
 class NonMixQueue(Queue[T]):
     """
     Queue without temporal mixing. Only have the noise generation when the queue is empty.
+
+    Since get() never blocks (it returns noise when empty), a plain deque is
+    enough and skips the framework queue indirection.
     """
 
     def __init__(self, framework: Framework, noise_msg: T):
-        self.__queue = framework.queue()
+        self.__queue: deque[T] = deque()
         self.__noise_msg = noise_msg
 
     async def put(self, data: T) -> None:
-        await self.__queue.put(data)
+        self.__queue.append(data)
 
     async def get(self) -> T:
-        if self.__queue.empty():
-            return self.__noise_msg
-        else:
-            return await self.__queue.get()
+        if self.__queue:
+            return self.__queue.popleft()
+        return self.__noise_msg
 
     def empty(self) -> bool:
-        return self.__queue.empty()
+        return not self.__queue
 
 
 class MixQueue(Queue[T]):
@@ -115,8 +107,11 @@ class MinSizeMixQueue(MixQueue[T]):
 
     @abstractmethod
     async def get(self) -> T:
-        while len(self._queue) < self._mix_pool_size:
-            self._queue.append(self._noise_msg)
+        # Pad the queue with noise messages in a single C-level extend.
+        # repeat() avoids allocating a temporary list for the padding.
+        deficit = self._mix_pool_size - len(self._queue)
+        if deficit > 0:
+            self._queue.extend(repeat(self._noise_msg, deficit))
 
         # Subclass must implement this method
         pass
@@ -127,12 +122,15 @@ class PureCoinFlipppingQueue(MinSizeMixQueue[T]):
         await super().get()
 
         while True:
-            for i in range(len(self._queue)):
-                # coin-flipping
-                if self._rng.randint(0, 1) == 1:
-                    # After removing a message from the position `i`, we don't fill up the position.
-                    # Instead, the queue is always filled from the back.
-                    return self._queue.pop(i)
+            # coin-flipping: draw all coins of a pass in a single call.
+            # The first successful flip is the lowest set bit,
+            # found with constant-time bit arithmetic instead of a Python scan.
+            coins = self._rng.getrandbits(len(self._queue))
+            if coins:
+                # pop(i) keeps the remaining messages in place: the coin
+                # scan is position-biased, so a swap-remove would change
+                # which messages sit in the favored positions.
+                return self._queue.pop((coins & -coins).bit_length() - 1)
 
 
 class PureRandomSamplingQueue(MinSizeMixQueue[T]):
@@ -141,8 +139,8 @@ class PureRandomSamplingQueue(MinSizeMixQueue[T]):
 
         i = self._rng.randint(0, len(self._queue) - 1)
         # After removing a message from the position `i`, we don't fill up the position.
-        # Instead, the queue is always filled from the back.
-        return self._queue.pop(i)
+        # Instead, the last message is swapped into the position.
+        return _swap_pop(self._queue, i)
 
 
 class PermutedCoinFlipppingQueue(MinSizeMixQueue[T]):
@@ -152,26 +150,66 @@ class PermutedCoinFlipppingQueue(MinSizeMixQueue[T]):
         self._rng.shuffle(self._queue)
 
         while True:
-            for i in range(len(self._queue)):
-                # coin-flipping
-                if self._rng.randint(0, 1) == 1:
-                    # After removing a message from the position `i`, we don't fill up the position.
-                    # Instead, the queue is always filled from the back.
-                    return self._queue.pop(i)
+            # coin-flipping: draw all coins of a pass in a single call.
+            # The first successful flip is the lowest set bit,
+            # found with constant-time bit arithmetic instead of a Python scan.
+            coins = self._rng.getrandbits(len(self._queue))
+            if coins:
+                # After removing a message from the position `i`, we don't fill up the position.
+                # Instead, the last message is swapped into the position.
+                return _swap_pop(self._queue, (coins & -coins).bit_length() - 1)
 
 
 class NoisyCoinFlippingQueue(MixQueue[T]):
+    def __init__(self, rng: random.Random, noise_msg: T):
+        super().__init__(rng, noise_msg)
+        # Only the head is ever released, so real messages leave in strict
+        # FIFO order; a deque makes that removal O(1) without reordering.
+        self._queue = deque()
+
     async def get(self) -> T:
         if len(self._queue) == 0:
             return self._noise_msg
 
-        while True:
-            for i in range(len(self._queue)):
-                # coin-flipping
-                if self._rng.randint(0, 1) == 1:
-                    # After removing a message from the position `i`, we don't fill up the position.
-                    # Instead, the queue is always filled from the back.
-                    return self._queue.pop(i)
-                else:
-                    if i == 0:
-                        return self._noise_msg
+        # Only the first coin matters: heads releases the head of the queue,
+        # tails emits a noise message.
+        if self._rng.getrandbits(1):
+            return self._queue.popleft()
+        return self._noise_msg
+
+
+# A constructor per mix type, so that TemporalMix.queue is a single dict lookup.
+_QUEUE_CTORS: dict[
+    TemporalMixType, Callable[[TemporalMixConfig, Framework, T], Queue[T]]
+] = {
+    TemporalMixType.NONE: lambda config, framework, noise_msg: NonMixQueue(
+        framework, noise_msg
+    ),
+    TemporalMixType.PURE_COIN_FLIPPING: (
+        lambda config, framework, noise_msg: PureCoinFlipppingQueue(
+            config.min_queue_size,
+            random.Random(config.seed_generator.random()),
+            noise_msg,
+        )
+    ),
+    TemporalMixType.PURE_RANDOM_SAMPLING: (
+        lambda config, framework, noise_msg: PureRandomSamplingQueue(
+            config.min_queue_size,
+            random.Random(config.seed_generator.random()),
+            noise_msg,
+        )
+    ),
+    TemporalMixType.PERMUTED_COIN_FLIPPING: (
+        lambda config, framework, noise_msg: PermutedCoinFlipppingQueue(
+            config.min_queue_size,
+            random.Random(config.seed_generator.random()),
+            noise_msg,
+        )
+    ),
+    TemporalMixType.NOISY_COIN_FLIPPING: (
+        lambda config, framework, noise_msg: NoisyCoinFlippingQueue(
+            random.Random(config.seed_generator.random()),
+            noise_msg,
+        )
+    ),
+}
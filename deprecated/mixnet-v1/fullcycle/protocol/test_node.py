@@ -1,3 +1,4 @@
+import asyncio
 from unittest import IsolatedAsyncioTestCase
 
 import framework.asyncio as asynciofw
@@ -40,19 +41,12 @@ class TestNode(IsolatedAsyncioTestCase):
 
         await nodes[0].send_message(b"block selection")
 
-        # Wait for all nodes to receive the broadcast
-        num_nodes_received_broadcast = 0
-        timeout = 15
-        for _ in range(timeout):
-            await framework.sleep(1)
-
-            while not queue.empty():
-                self.assertEqual(b"block selection", await queue.get())
-                num_nodes_received_broadcast += 1
-
-            if num_nodes_received_broadcast == len(nodes):
-                break
-
-        self.assertEqual(len(nodes), num_nodes_received_broadcast)
+        # Wait for all nodes to receive the broadcast,
+        # draining messages as they arrive instead of polling every second.
+        deadline = asyncio.get_running_loop().time() + 15
+        for _ in nodes:
+            remaining = deadline - asyncio.get_running_loop().time()
+            msg = await asyncio.wait_for(queue.get(), timeout=remaining)
+            self.assertEqual(b"block selection", msg)
 
     # TODO: check noise
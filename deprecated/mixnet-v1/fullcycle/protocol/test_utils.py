@@ -28,19 +28,16 @@ def init_mixnet_config(
         )
         for _ in range(num_nodes)
     ]
+    # Derive each public key once: X25519 key derivation is the expensive part.
+    public_keys = [node_config.private_key.public_key() for node_config in node_configs]
     global_config = GlobalConfig(
-        MixMembership(
-            [
-                NodeInfo(node_config.private_key.public_key())
-                for node_config in node_configs
-            ]
-        ),
+        MixMembership([NodeInfo(public_key) for public_key in public_keys]),
         transmission_rate_per_sec=3,
         max_message_size=max_message_size,
         max_mix_path_length=max_mix_path_length,
     )
     key_map = {
-        node_config.private_key.public_key().public_bytes_raw(): node_config.private_key
-        for node_config in node_configs
+        public_key.public_bytes_raw(): node_config.private_key
+        for public_key, node_config in zip(public_keys, node_configs)
     }
     return (global_config, node_configs, key_map)
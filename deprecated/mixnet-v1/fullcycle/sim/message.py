@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from typing import Self
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """
     A message structure for simulation, which will be sent through mix nodes